@@ -5,6 +5,8 @@ from datetime import date, datetime, timedelta
 from itertools import combinations
 from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
+import numpy as np
+import shapely
 from shapely.geometry import shape
 from shapely.ops import transform as shp_transform
 
@@ -66,6 +68,23 @@ class RankedCandidate:
     dist_days: int
 
 
+@dataclass(frozen=True)
+class PrecomputedCoverage:
+    """
+    Coverage already computed by TileSelector._coverage_infos, to be reused by
+    select_regular_time_series instead of recomputing footprints.
+
+    - aoi_geom_4326: the AOI passed to _coverage_infos (checked on reuse)
+    - infos: CoverageInfo list from that call (may be filtered, e.g. by timestamp)
+    - aoi_area_value: AOI area returned by that call (same CRS as the infos)
+    - min_intersection_frac: threshold of the selector that ran it (checked on reuse)
+    """
+    aoi_geom_4326: Any
+    infos: List[CoverageInfo]
+    aoi_area_value: float
+    min_intersection_frac: float
+
+
 class TileSelector:
     """
     Build a *regular* time series over a period T by selecting the best *real* scene around
@@ -198,6 +217,7 @@ class TileSelector:
         period_end: date,
         n_anchors: int,
         window_days: int = 15,
+        coverage: Optional[PrecomputedCoverage] = None,
     ) -> List[SelectedScene]:
         """
         Build the regular-grid catalog:
@@ -209,6 +229,11 @@ class TileSelector:
           - If a timestamp has some coverage but no such union, _best_union_for_timestamp
             raises ValueError and that timestamp will not be silently downgraded to
             a partial-coverage union.
+          - coverage: optional PrecomputedCoverage built from
+            self._coverage_infos(items, aoi_geom_4326) on the SAME AOI, by a selector
+            with the same min_intersection_frac; skips recomputing footprints.
+            Its infos must only refer to items in `items`. A coverage computed for a
+            different AOI or min_intersection_frac raises ValueError.
         """
         if not items:
             return []
@@ -222,7 +247,17 @@ class TileSelector:
         anchors = self._make_midpoint_anchors(period_start, period_end, n_anchors)
         half = window_days // 2
 
-        infos_all, _, _, aoi_area_value = self._coverage_infos(items, aoi_geom_4326)
+        if coverage is not None:
+            if not coverage.aoi_geom_4326.equals(aoi_geom_4326):
+                raise ValueError("coverage was computed for a different AOI than aoi_geom_4326")
+            if coverage.min_intersection_frac != self.min_intersection_frac:
+                raise ValueError(
+                    "coverage was computed with a different min_intersection_frac "
+                    f"({coverage.min_intersection_frac} != {self.min_intersection_frac})"
+                )
+            infos_all, aoi_area_value = coverage.infos, coverage.aoi_area_value
+        else:
+            infos_all, _, _, aoi_area_value = self._coverage_infos(items, aoi_geom_4326)
         if not infos_all or aoi_area_value <= 0:
             return []
 
@@ -331,10 +366,13 @@ class TileSelector:
     # ------------------------------------------------------------------
     # Internals: item access
     # ------------------------------------------------------------------
-    def _get_prop(self, item: ItemLike, key: str, default=None):
+    def _get_props(self, item: ItemLike) -> Mapping[str, Any]:
         if hasattr(item, "properties"):
-            return (item.properties or {}).get(key, default)
-        return (item.get("properties", {}) or {}).get(key, default)
+            return item.properties or {}
+        return item.get("properties", {}) or {}
+
+    def _get_prop(self, item: ItemLike, key: str, default=None):
+        return self._get_props(item).get(key, default)
 
     def _get_geometry(self, item: ItemLike) -> Dict[str, Any]:
         """
@@ -368,8 +406,10 @@ class TileSelector:
         raise ValueError("Item missing datetime (properties.datetime or item.datetime).")
 
     def _get_cloud(self, item: ItemLike) -> float:
+        # Resolve the item's properties once, not once per cloud key
+        props = self._get_props(item)
         for k in self.cloud_keys:
-            v = self._get_prop(item, k)
+            v = props.get(k)
             if v is not None:
                 try:
                     return float(v)
@@ -408,25 +448,58 @@ class TileSelector:
         proj, aoi_area_geom = self._to_area_crs(aoi_geom_4326)
         aoi_area_value = float(aoi_area_geom.area) if aoi_area_geom.area else 0.0
 
-        infos: List[CoverageInfo] = []
-        for it in items:
-            footprint_4326 = shape(self._get_geometry(it))
-            acq_dt = self._get_datetime(it)
+        footprints = np.empty(len(items), dtype=object)
+        acq_dts: List[datetime] = []
+        for i, it in enumerate(items):
+            footprints[i] = shape(self._get_geometry(it))
+            acq_dts.append(self._get_datetime(it))
+
+        # Filter then refine: footprints whose bounding box misses the AOI's are
+        # dropped with array comparisons; the prepared AOI predicate only runs
+        # on the rest. Both happen before the costly reprojection + intersection.
+        minx, miny, maxx, maxy = aoi_geom_4326.bounds
+        fb = shapely.bounds(footprints).reshape(-1, 4)
+        near = np.flatnonzero(
+            (fb[:, 0] <= maxx) & (fb[:, 2] >= minx) & (fb[:, 1] <= maxy) & (fb[:, 3] >= miny)
+        )
 
-            if proj is not None:
-                footprint_area = shp_transform(proj, footprint_4326)
-                inter = aoi_area_geom.intersection(footprint_area)
-            else:
-                inter = aoi_geom_4326.intersection(footprint_4326)
+        # Prepare a copy: shapely.prepare works in place and the AOI is the caller's
+        aoi_prepared = shapely.from_wkb(shapely.to_wkb(aoi_geom_4326))
+        shapely.prepare(aoi_prepared)
+        hit = near[shapely.intersects(aoi_prepared, footprints[near])]
 
-            if inter.is_empty:
+        # Tiles repeat across acquisition dates with identical footprints:
+        # do the geometry work once per distinct footprint (keyed by WKB)
+        _, first, inverse = np.unique(
+            shapely.to_wkb(footprints[hit]), return_index=True, return_inverse=True
+        )
+        distinct = footprints[hit[first]]
+
+        # Reproject / intersect / measure all distinct footprints in bulk
+        # (one pyproj call and one GEOS call per step instead of one per item)
+        if proj is not None:
+            distinct_area = shapely.transform(
+                distinct,
+                lambda xy: np.column_stack(proj(xy[:, 0], xy[:, 1])),
+            )
+            distinct_inters = shapely.intersection(aoi_area_geom, distinct_area)
+        else:
+            distinct_inters = shapely.intersection(aoi_geom_4326, distinct)
+        inters = distinct_inters[inverse]
+        inter_areas = shapely.area(distinct_inters)[inverse].tolist()
+        inter_empty = shapely.is_empty(distinct_inters)[inverse].tolist()
+
+        infos: List[CoverageInfo] = []
+        for i, inter, inter_area, is_empty in zip(hit.tolist(), inters, inter_areas, inter_empty):
+            if is_empty:
                 continue
 
-            inter_area = float(inter.area)
             frac = (inter_area / aoi_area_value) if aoi_area_value > 0 else 0.0
             if frac < self.min_intersection_frac:
                 continue
 
+            it = items[i]
+            acq_dt = acq_dts[i]
             infos.append(
                 CoverageInfo(
                     item=it,
@@ -6,11 +6,12 @@ from pathlib import Path
 
 import pandas as pd
 from shapely.geometry import shape
+from shapely.ops import unary_union
 
 from thess_geo_analytics.builders.SceneCatalogBuilder import SceneCatalogBuilder
 from thess_geo_analytics.core.params import StacQueryParams
 from thess_geo_analytics.core.settings import DEFAULT_COLLECTION
-from thess_geo_analytics.geo.TileSelector import TileSelector
+from thess_geo_analytics.geo.TileSelector import PrecomputedCoverage, TileSelector
 from thess_geo_analytics.utils.RepoPaths import RepoPaths
 
 
@@ -164,6 +165,7 @@ class BuildSceneCatalogPipeline:
         # 3) Selection -> selected_scenes (regular anchors)
         # ------------------------------------------------------------------
         aoi_shp = shape(aoi_geom_geojson)
+        aoi_sel_geom = aoi_shp.buffer(0.05)
 
         selector = TileSelector(
             full_cover_threshold=params.full_cover_threshold,
@@ -174,7 +176,7 @@ class BuildSceneCatalogPipeline:
         # ------------------------------------------------------------------
         # 3a) per-timestamp coverage table
         # ------------------------------------------------------------------
-        infos, _, _, aoi_area_value = selector._coverage_infos(items, aoi_shp.buffer(0.05))
+        infos, _, _, aoi_area_value = selector._coverage_infos(items, aoi_sel_geom)
 
         cov_rows = []
         if infos and aoi_area_value > 0:
@@ -185,9 +187,8 @@ class BuildSceneCatalogPipeline:
                 by_ts[ci.acq_dt].append(ci)
 
             for dt, cis in by_ts.items():
-                union_geom = cis[0].covered_geom
-                for ci in cis[1:]:
-                    union_geom = union_geom.union(ci.covered_geom)
+                # Cascaded union in one GEOS call instead of pairwise .union()
+                union_geom = unary_union([ci.covered_geom for ci in cis])
 
                 coverage_frac = float(union_geom.area) / float(aoi_area_value)
                 tiles_count = len(cis)
@@ -291,11 +292,18 @@ class BuildSceneCatalogPipeline:
         try:
             selected_scenes = selector.select_regular_time_series(
                 items=items_for_selector,
-                aoi_geom_4326=aoi_shp.buffer(0.05),
+                aoi_geom_4326=aoi_sel_geom,
                 period_start=start,
                 period_end=end,
                 n_anchors=params.n_anchors,
                 window_days=params.window_days,
+                # Same AOI as 3a: reuse those footprints/intersections
+                coverage=PrecomputedCoverage(
+                    aoi_geom_4326=aoi_sel_geom,
+                    infos=[ci for ci in infos if ci.acq_dt in good_ts],
+                    aoi_area_value=aoi_area_value,
+                    min_intersection_frac=selector.min_intersection_frac,
+                ),
             )
         except ValueError as e:
             print(
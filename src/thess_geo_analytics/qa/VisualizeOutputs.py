@@ -6,6 +6,7 @@ from typing import Dict, List
 
 import numpy as np
 import rasterio
+from rasterio.enums import Resampling
 
 
 def parse_args() -> argparse.Namespace:
@@ -34,12 +35,23 @@ def parse_args() -> argparse.Namespace:
         default=Path("outputs/figures"),
         help="Directory where PNG previews are written in headless mode.",
     )
+    parser.add_argument(
+        "--raw-previews",
+        action="store_true",
+        help=(
+            "Write bare colormapped PNGs (no title/colorbar) with Pillow instead of "
+            "rendering matplotlib figures. Fastest option for CI. Implies --save-previews."
+        ),
+    )
     parser.add_argument(
         "--no-prompt",
         action="store_true",
         help="Disable interactive prompts and process everything automatically.",
     )
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.raw_previews:
+        args.save_previews = True
+    return args
 
 
 ARGS = parse_args()
@@ -59,18 +71,47 @@ def _compute_vrange(arr: np.ndarray | np.ma.MaskedArray, vmin=None, vmax=None):
     if vmin is not None and vmax is not None:
         return vmin, vmax
 
-    data = arr.compressed() if np.ma.isMaskedArray(arr) else arr.ravel()
+    if np.ma.is_masked(arr):
+        data = arr.compressed()
+    else:
+        # No masked pixels: use the underlying buffer without a compressed() copy
+        data = np.ma.getdata(arr).ravel()
     if data.size == 0:
         return -1, 1
 
+    # Both percentiles from a single partition pass
+    lo, hi = np.quantile(data, [0.02, 0.98])
     if vmin is None:
-        vmin = np.percentile(data, 2)
+        vmin = lo
     if vmax is None:
-        vmax = np.percentile(data, 98)
+        vmax = hi
 
     return vmin, vmax
 
 
+# Previews are shown at ~1200x900 px; reading more than this per axis only
+# slows down the read and the Agg rasterizer.
+_PREVIEW_MAX_DIM = 2000
+
+
+def _read_preview_band(src: rasterio.io.DatasetReader, band: int) -> np.ma.MaskedArray:
+    """
+    Read one band as a masked array, decimated by an integer factor so that
+    neither side exceeds _PREVIEW_MAX_DIM. GDAL serves decimated reads from
+    the COG overviews when they exist.
+    """
+    scale = max(1, -(-max(src.width, src.height) // _PREVIEW_MAX_DIM))
+    if scale == 1:
+        return src.read(band, masked=True)
+
+    return src.read(
+        band,
+        masked=True,
+        out_shape=(max(1, src.height // scale), max(1, src.width // scale)),
+        resampling=Resampling.average,
+    )
+
+
 def _slugify_filename(name: str) -> str:
     safe = []
     for ch in name:
@@ -81,6 +122,30 @@ def _slugify_filename(name: str) -> str:
     return "".join(safe).strip("_")
 
 
+def _new_band_figure(
+    arr: np.ndarray | np.ma.MaskedArray,
+    title: str,
+    *,
+    cmap: str,
+    vmin,
+    vmax,
+):
+    """Single-band preview figure: image + colorbar, no axes. Returns (fig, ax, im)."""
+    fig, ax = plt.subplots(figsize=(8, 6))
+    im = ax.imshow(arr, cmap=cmap, vmin=vmin, vmax=vmax)
+    ax.set_title(title)
+    fig.colorbar(im, ax=ax)
+    ax.axis("off")
+    fig.tight_layout()
+    return fig, ax, im
+
+
+def _save_figure(fig, save_path: Path) -> None:
+    save_path.parent.mkdir(parents=True, exist_ok=True)
+    fig.savefig(save_path, dpi=150, bbox_inches="tight")
+    print(f"[QA] Saved preview: {save_path}")
+
+
 def _render_single_band(
     arr: np.ndarray | np.ma.MaskedArray,
     title: str,
@@ -92,21 +157,50 @@ def _render_single_band(
 ) -> None:
     vmin, vmax = _compute_vrange(arr, vmin=vmin, vmax=vmax)
 
-    plt.figure(figsize=(8, 6))
-    plt.imshow(arr, cmap=cmap, vmin=vmin, vmax=vmax)
-    plt.title(title)
-    plt.colorbar()
-    plt.axis("off")
-    plt.tight_layout()
+    fig, _, _ = _new_band_figure(arr, title, cmap=cmap, vmin=vmin, vmax=vmax)
 
     if save_path is not None:
-        save_path.parent.mkdir(parents=True, exist_ok=True)
-        plt.savefig(save_path, dpi=150, bbox_inches="tight")
-        plt.close()
-        print(f"[QA] Saved preview: {save_path}")
+        _save_figure(fig, save_path)
     else:
         plt.show()
-        plt.close()
+    plt.close(fig)
+
+
+def _save_raw_preview(
+    arr: np.ndarray | np.ma.MaskedArray,
+    save_path: Path,
+    *,
+    cmap: str = "RdYlGn",
+    vmin=None,
+    vmax=None,
+) -> None:
+    """
+    Colormap a band straight to an RGBA PNG with Pillow, without creating a
+    matplotlib figure. Masked and non-finite pixels are fully transparent.
+    """
+    from matplotlib import colormaps
+    from PIL import Image
+
+    data = np.ma.getdata(arr).astype(np.float32, copy=False)
+    valid = np.isfinite(data) & ~np.ma.getmaskarray(arr)
+
+    # Stretch over valid pixels only: NaN left unmasked (e.g. a band whose
+    # nodata is not NaN) would otherwise turn the percentiles into NaN
+    vmin, vmax = _compute_vrange(data[valid], vmin=vmin, vmax=vmax)
+    span = (vmax - vmin) or 1.0
+
+    idx = (data - vmin) * (255.0 / span)
+    np.clip(idx, 0, 255, out=idx)
+    idx[~valid] = 0
+
+    lut = (colormaps[cmap](np.arange(256))[:, :3] * 255).astype(np.uint8)
+    rgba = np.empty(data.shape + (4,), dtype=np.uint8)
+    rgba[..., :3] = lut[idx.astype(np.uint8)]
+    rgba[..., 3] = np.where(valid, 255, 0)
+
+    save_path.parent.mkdir(parents=True, exist_ok=True)
+    Image.fromarray(rgba).save(save_path, "PNG")
+    print(f"[QA] Saved preview: {save_path}")
 
 
 def show_ndvi_like_raster(
@@ -114,10 +208,11 @@ def show_ndvi_like_raster(
     label: str,
     *,
     save_previews: bool = False,
+    raw_previews: bool = False,
     out_dir: Path | None = None,
 ) -> None:
     with rasterio.open(path) as src:
-        arr = src.read(1, masked=True)
+        arr = _read_preview_band(src, 1)
 
     title = f"{label} - {path.name}"
     save_path = None
@@ -126,6 +221,11 @@ def show_ndvi_like_raster(
         save_name = _slugify_filename(path.stem) + ".png"
         save_path = out_dir / save_name
 
+    if raw_previews:
+        assert save_path is not None
+        _save_raw_preview(arr, save_path, cmap="RdYlGn", vmin=-1, vmax=1)
+        return
+
     _render_single_band(
         arr,
         title=title,
@@ -141,39 +241,69 @@ def show_multiband_raster(
     label: str,
     *,
     save_previews: bool = False,
+    raw_previews: bool = False,
     out_dir: Path | None = None,
     no_prompt: bool = False,
 ) -> None:
-    with rasterio.open(path) as src:
-        count = src.count
-
-        for b in range(1, count + 1):
-            arr = src.read(b, masked=True)
-            title = f"{label} - {path.name} - band {b}/{count}"
-
-            save_path = None
-            if save_previews:
-                assert out_dir is not None
-                save_name = _slugify_filename(f"{path.stem}_band_{b}") + ".png"
-                save_path = out_dir / save_name
-
-            _render_single_band(
-                arr,
-                title=title,
-                cmap="viridis",
-                save_path=save_path,
-            )
-
-            if save_previews or no_prompt:
-                continue
-
-            if b < count:
-                resp = input(
-                    f"[{path.name}] Shown band {b}/{count}. "
-                    "Press <Enter> for next band, or 'q' to stop this raster: "
-                ).strip().lower()
-                if resp == "q":
-                    break
+    # One figure / AxesImage per raster: bands are swapped in with set_data()
+    # instead of rebuilding the canvas, colorbar and layout for every band.
+    fig = ax = im = None
+
+    try:
+        with rasterio.open(path) as src:
+            count = src.count
+
+            for b in range(1, count + 1):
+                arr = _read_preview_band(src, b)
+                title = f"{label} - {path.name} - band {b}/{count}"
+
+                save_path = None
+                if save_previews:
+                    assert out_dir is not None
+                    save_name = _slugify_filename(f"{path.stem}_band_{b}") + ".png"
+                    save_path = out_dir / save_name
+
+                if raw_previews:
+                    assert save_path is not None
+                    _save_raw_preview(arr, save_path, cmap="viridis")
+                    continue
+
+                vmin, vmax = _compute_vrange(arr)
+
+                if im is None:
+                    fig, ax, im = _new_band_figure(
+                        arr, title, cmap="viridis", vmin=vmin, vmax=vmax
+                    )
+                else:
+                    im.set_data(arr)
+                    im.set_clim(vmin, vmax)
+                    ax.set_title(title)
+
+                if save_path is not None:
+                    _save_figure(fig, save_path)
+                    continue
+
+                if no_prompt or b == count:
+                    # Blocks until the window is closed
+                    plt.show()
+                else:
+                    plt.show(block=False)
+                    fig.canvas.draw_idle()
+                    plt.pause(0.001)
+
+                    resp = input(
+                        f"[{path.name}] Shown band {b}/{count}. "
+                        "Press <Enter> for next band, or 'q' to stop this raster: "
+                    ).strip().lower()
+                    if resp == "q":
+                        break
+
+                if not plt.fignum_exists(fig.number):
+                    # Window closed by the user: start a fresh figure next band
+                    fig = ax = im = None
+    finally:
+        if fig is not None:
+            plt.close(fig)
 
 
 # -----------------------------
@@ -254,24 +384,7 @@ def ask_groups_to_visualize(groups: Dict[str, List[Path]], *, no_prompt: bool =
 # -----------------------------
 # Main entry point
 # -----------------------------
-def main() -> None:
-    if not ARGS.cogs_dir.exists():
-        print(f"Directory not found: {ARGS.cogs_dir}")
-        return
-
-    if ARGS.save_previews:
-        ARGS.out_dir.mkdir(parents=True, exist_ok=True)
-
-    groups = group_rasters(ARGS.cogs_dir)
-    selected_keys = ask_groups_to_visualize(groups, no_prompt=ARGS.no_prompt or ARGS.save_previews)
-
-    if not selected_keys:
-        print("No groups selected. Exiting.")
-        return
-
-    mode_label = "headless preview export" if ARGS.save_previews else "interactive visualization"
-    print(f"\nStarting {mode_label}...")
-
+def _visualize_groups(groups: Dict[str, List[Path]], selected_keys: List[str]) -> None:
     for key in selected_keys:
         paths = groups[key]
         if not paths:
@@ -295,6 +408,7 @@ def main() -> None:
                     p,
                     label=label,
                     save_previews=ARGS.save_previews,
+                    raw_previews=ARGS.raw_previews,
                     out_dir=group_out_dir,
                     no_prompt=ARGS.no_prompt or ARGS.save_previews,
                 )
@@ -303,6 +417,7 @@ def main() -> None:
                     p,
                     label=label,
                     save_previews=ARGS.save_previews,
+                    raw_previews=ARGS.raw_previews,
                     out_dir=group_out_dir,
                 )
 
@@ -315,6 +430,29 @@ def main() -> None:
             if resp == "q":
                 break
 
+
+def main() -> None:
+    if not ARGS.cogs_dir.exists():
+        print(f"Directory not found: {ARGS.cogs_dir}")
+        return
+
+    if ARGS.save_previews:
+        ARGS.out_dir.mkdir(parents=True, exist_ok=True)
+
+    groups = group_rasters(ARGS.cogs_dir)
+    selected_keys = ask_groups_to_visualize(groups, no_prompt=ARGS.no_prompt or ARGS.save_previews)
+
+    if not selected_keys:
+        print("No groups selected. Exiting.")
+        return
+
+    mode_label = "headless preview export" if ARGS.save_previews else "interactive visualization"
+    print(f"\nStarting {mode_label}...")
+
+    # One GDAL environment (and block cache) for the whole pass
+    with rasterio.Env(GDAL_CACHEMAX=512):
+        _visualize_groups(groups, selected_keys)
+
     print("\n[QA] Visualization complete.")
 
 
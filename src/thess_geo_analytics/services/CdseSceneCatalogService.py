@@ -38,10 +38,14 @@ class CdseSceneCatalogService:
     # ------------------------------------------------------------------
     # AOI geometry loader
     # ------------------------------------------------------------------
-    def load_aoi_geometry(self, aoi_geojson_path: str | Path) -> Dict[str, Any]:
+    @staticmethod
+    def load_aoi_geometry(aoi_geojson_path: str | Path) -> Dict[str, Any]:
         """
         Loads AOI geometry from a GeoJSON file.
         Returns a GeoJSON geometry dict (EPSG:4326 expected).
+
+        Static: callers that only need the AOI can use
+        CdseSceneCatalogService.load_aoi_geometry(path) without a service instance.
         """
         p = Path(aoi_geojson_path)
         if not p.exists():
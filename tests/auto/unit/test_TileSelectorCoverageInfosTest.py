@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import unittest
+from datetime import date, datetime, timezone
+from unittest import mock
+
+import shapely
+from shapely.geometry import box, mapping, shape
+from shapely.ops import transform as shp_transform
+
+from thess_geo_analytics.geo import TileSelector as tile_selector_module
+from thess_geo_analytics.geo.TileSelector import PrecomputedCoverage, TileSelector
+
+
+def _item(item_id: str, geom, day: int, cloud: float) -> dict:
+    return {
+        "id": item_id,
+        "geometry": mapping(geom),
+        "properties": {
+            "datetime": datetime(2021, 3, day, 9, 30, tzinfo=timezone.utc).isoformat(),
+            "cloud_cover": cloud,
+        },
+    }
+
+
+class TileSelectorCoverageInfosTest(unittest.TestCase):
+
+    # AOI around Thessaloniki, in EPSG:4326
+    AOI = box(22.8, 40.5, 23.0, 40.7)
+
+    def setUp(self):
+
+        partial = box(22.9, 40.6, 23.1, 40.8)
+
+        self.items = [
+            # overlaps the AOI's north-east quarter
+            _item("partial", partial, 1, 10.0),
+            # same footprint, later acquisition: must give the same intersection
+            _item("partial_repeat", partial, 6, 20.0),
+            # covers the whole AOI
+            _item("full", box(22.7, 40.4, 23.1, 40.8), 2, 5.0),
+            # far away: dropped by the bbox prefilter
+            _item("disjoint", box(24.0, 41.0, 24.2, 41.2), 3, 1.0),
+            # shares the AOI's east edge: zero-area intersection
+            _item("touching", box(23.0, 40.5, 23.2, 40.7), 4, 2.0),
+            # bbox overlaps the AOI but the triangle itself does not
+            _item(
+                "bbox_only",
+                shapely.Polygon([(23.05, 40.45), (23.3, 40.45), (23.3, 40.75)]),
+                5,
+                3.0,
+            ),
+        ]
+
+    # ---------------------------------------------------------
+    # helper
+    # ---------------------------------------------------------
+
+    def _reference(self, selector: TileSelector, items, aoi):
+        """Straightforward per-item reprojection + intersection."""
+
+        proj, aoi_area_geom = selector._to_area_crs(aoi)
+        aoi_area_value = float(aoi_area_geom.area)
+
+        out = []
+        for it in items:
+            fp = shape(selector._get_geometry(it))
+            if not fp.intersects(aoi):
+                continue
+            fp_area = shp_transform(proj, fp) if proj is not None else fp
+            inter = aoi_area_geom.intersection(fp_area)
+            if inter.is_empty:
+                continue
+            frac = inter.area / aoi_area_value if aoi_area_value > 0 else 0.0
+            if frac < selector.min_intersection_frac:
+                continue
+            out.append((it["id"], selector._get_cloud(it), frac, selector._get_datetime(it), inter))
+
+        return out
+
+    def _series_items(self):
+        """
+        Full-cover scenes plus one date covered only by a west/east pair.
+        Partial-only dates are left out: the selector raises on them.
+        """
+
+        west = box(22.7, 40.4, 22.9, 40.8)
+        east = box(22.9, 40.4, 23.1, 40.8)
+
+        return [it for it in self.items if not it["id"].startswith("partial")] + [
+            _item("full_b", box(22.7, 40.4, 23.1, 40.8), 12, 30.0),
+            _item("west", west, 20, 4.0),
+            _item("east", east, 20, 6.0),
+            _item("full_c", box(22.7, 40.4, 23.1, 40.8), 27, 1.0),
+        ]
+
+    def _select(self, selector: TileSelector, items, aoi, **kwargs):
+
+        return selector.select_regular_time_series(
+            items,
+            aoi,
+            period_start=date(2021, 3, 1),
+            period_end=date(2021, 3, 31),
+            n_anchors=4,
+            window_days=8,
+            **kwargs,
+        )
+
+    def _assert_matches_reference(self, items):
+
+        selector = TileSelector()
+        aoi = shapely.from_wkb(shapely.to_wkb(self.AOI))
+
+        infos, _, _, _ = selector._coverage_infos(items, aoi)
+        expected = self._reference(selector, items, aoi)
+
+        self.assertEqual(
+            [ci.item["id"] for ci in infos],
+            [e[0] for e in expected],
+        )
+        for ci, (_, cloud, frac, acq_dt, inter) in zip(infos, expected):
+            self.assertEqual(ci.cloud, cloud)
+            self.assertAlmostEqual(ci.frac, frac, places=9)
+            self.assertEqual(ci.acq_dt, acq_dt)
+            self.assertEqual(ci.acq_date, acq_dt.date())
+            self.assertTrue(ci.covered_geom.equals(inter))
+
+        # The caller's AOI is left untouched
+        self.assertFalse(shapely.is_prepared(aoi))
+
+        return infos
+
+    # ---------------------------------------------------------
+    # tests
+    # ---------------------------------------------------------
+
+    def test_mixed_footprints_with_pyproj(self):
+
+        if tile_selector_module.Transformer is None:
+            self.skipTest("pyproj not installed")
+
+        infos = self._assert_matches_reference(self.items)
+
+        self.assertEqual(
+            [ci.item["id"] for ci in infos],
+            ["partial", "partial_repeat", "full"],
+        )
+        self.assertAlmostEqual(infos[2].frac, 1.0, places=6)
+
+    def test_mixed_footprints_without_pyproj(self):
+
+        with mock.patch.object(tile_selector_module, "Transformer", None):
+            infos = self._assert_matches_reference(self.items)
+
+        self.assertEqual(
+            [ci.item["id"] for ci in infos],
+            ["partial", "partial_repeat", "full"],
+        )
+        # degrees^2 areas: the NE quarter of the AOI
+        self.assertAlmostEqual(infos[0].frac, 0.25, places=9)
+
+    def test_repeated_footprints_share_the_intersection(self):
+
+        infos = self._assert_matches_reference(self.items)
+
+        self.assertTrue(infos[0].covered_geom.equals(infos[1].covered_geom))
+        self.assertEqual(infos[0].frac, infos[1].frac)
+        self.assertNotEqual(infos[0].acq_dt, infos[1].acq_dt)
+
+    def test_empty_input(self):
+
+        for transformer in (tile_selector_module.Transformer, None):
+            with mock.patch.object(tile_selector_module, "Transformer", transformer):
+                infos, _, _, aoi_area_value = TileSelector()._coverage_infos([], self.AOI)
+
+            self.assertEqual(infos, [])
+            self.assertGreater(aoi_area_value, 0.0)
+
+    def test_precomputed_coverage_matches_default_path(self):
+
+        items = self._series_items()
+
+        for transformer in (tile_selector_module.Transformer, None):
+            with mock.patch.object(tile_selector_module, "Transformer", transformer):
+                selector = TileSelector()
+                infos, _, _, aoi_area_value = selector._coverage_infos(items, self.AOI)
+
+                expected = self._select(selector, items, self.AOI)
+                reused = self._select(
+                    selector,
+                    items,
+                    self.AOI,
+                    coverage=PrecomputedCoverage(
+                        aoi_geom_4326=self.AOI,
+                        infos=infos,
+                        aoi_area_value=aoi_area_value,
+                        min_intersection_frac=selector.min_intersection_frac,
+                    ),
+                )
+
+            self.assertGreater(len(expected), 0)
+            self.assertIn(["west", "east"], [[it["id"] for it in s.items] for s in expected])
+            self.assertEqual(reused, expected)
+
+    def test_precomputed_coverage_for_another_aoi_raises(self):
+
+        items = self._series_items()
+        selector = TileSelector()
+        other_aoi = box(22.8, 40.5, 22.95, 40.7)
+        infos, _, _, aoi_area_value = selector._coverage_infos(items, other_aoi)
+
+        with self.assertRaises(ValueError):
+            self._select(
+                selector,
+                items,
+                self.AOI,
+                coverage=PrecomputedCoverage(
+                    aoi_geom_4326=other_aoi,
+                    infos=infos,
+                    aoi_area_value=aoi_area_value,
+                    min_intersection_frac=selector.min_intersection_frac,
+                ),
+            )
+
+    def test_precomputed_coverage_with_another_min_intersection_frac_raises(self):
+
+        items = self._series_items()
+        infos, _, _, aoi_area_value = TileSelector(min_intersection_frac=0.3)._coverage_infos(
+            items, self.AOI
+        )
+
+        with self.assertRaises(ValueError):
+            self._select(
+                TileSelector(),
+                items,
+                self.AOI,
+                coverage=PrecomputedCoverage(
+                    aoi_geom_4326=self.AOI,
+                    infos=infos,
+                    aoi_area_value=aoi_area_value,
+                    min_intersection_frac=0.3,
+                ),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
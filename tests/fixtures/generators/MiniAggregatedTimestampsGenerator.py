@@ -5,8 +5,11 @@ from pathlib import Path
 from typing import Tuple
 
 import numpy as np
-import rasterio
-from rasterio.transform import from_origin
+
+from tests.fixtures.generators._common import (
+    BASE_PROFILE_FLOAT32_10M,
+    origin_transform,
+)
 
 
 @dataclass
@@ -89,6 +92,8 @@ class MiniNdviSceneGenerator:
         scl_path : Path
             Path to written SCL GeoTIFF (simple classification; all valid).
         """
+        import rasterio
+
         cfg = self.cfg
         out_dir = cfg.out_dir
         out_dir.mkdir(parents=True, exist_ok=True)
@@ -116,16 +121,12 @@ class MiniNdviSceneGenerator:
         # 4) Simple SCL: all "valid vegetation" (e.g. code 4) for now
         scl = np.full((H, W), 4, dtype="uint16")
 
-        transform = from_origin(0.0, 0.0, cfg.pixel_size, cfg.pixel_size)
-
         base_profile = {
-            "driver": "GTiff",
+            **BASE_PROFILE_FLOAT32_10M,
             "height": H,
             "width": W,
-            "count": 1,
-            "dtype": "float32",
             "crs": cfg.crs,
-            "transform": transform,
+            "transform": origin_transform(cfg.pixel_size),
             "nodata": cfg.nodata,
             "compress": "deflate",
         }
@@ -5,8 +5,11 @@ from pathlib import Path
 from typing import Dict, Any, List
 
 import numpy as np
-import rasterio
-from rasterio.transform import from_origin
+
+from tests.fixtures.generators._common import (
+    BASE_PROFILE_FLOAT32_10M,
+    origin_transform,
+)
 
 
 @dataclass
@@ -115,17 +118,16 @@ class MiniAnomalyRasterGenerator:
         Write a single-band GeoTIFF with deflate compression.
         We don't care about tiling here; these are just test inputs.
         """
+        import rasterio
+
         H, W = arr.shape
-        transform = from_origin(0.0, 0.0, cfg.pixel_size, cfg.pixel_size)
 
         profile = {
-            "driver": "GTiff",
+            **BASE_PROFILE_FLOAT32_10M,
             "height": H,
             "width": W,
-            "count": 1,
-            "dtype": "float32",
             "crs": cfg.crs,
-            "transform": transform,
+            "transform": origin_transform(cfg.pixel_size),
             "nodata": cfg.nodata,
             "compress": "deflate",
         }
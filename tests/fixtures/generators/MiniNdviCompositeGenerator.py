@@ -5,8 +5,8 @@ from pathlib import Path
 from typing import List
 
 import numpy as np
-import rasterio
-from rasterio.transform import from_origin
+
+from tests.fixtures.generators._common import BASE_PROFILE_FLOAT32_10M
 
 
 @dataclass(frozen=True)
@@ -40,21 +40,19 @@ class MiniNdviCompositeGenerator:
         """
         Returns list of created COG paths.
         """
+        import rasterio
+
         outputs_root = self.cfg.root / "outputs"
         cogs_dir = outputs_root / "cogs"
         cogs_dir.mkdir(parents=True, exist_ok=True)
 
         created: List[Path] = []
 
-        transform = from_origin(0.0, 0.0, 10.0, 10.0)
         base_profile = {
-            "driver": "GTiff",
+            **BASE_PROFILE_FLOAT32_10M,
             "height": self.cfg.height,
             "width": self.cfg.width,
-            "count": 1,
-            "dtype": "float32",
             "crs": "EPSG:32634",
-            "transform": transform,
             "nodata": -9999.0,
         }
 
@@ -1,19 +1,119 @@
 from __future__ import annotations
 
+import csv
 import json
 import logging
-import random
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
-import pandas as pd
-from shapely.geometry import box, mapping
-from shapely.ops import unary_union
+import numpy as np
+import shapely
+from shapely.geometry import Polygon
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used as a fallback
+    orjson = None
 
 LOG = logging.getLogger(__name__)
 
+# Outline of the test AOI, precomputed once per process:
+#
+#   union(box(23.0, 40.0, 23.12, 40.12),     main body
+#         box(23.08, 40.12, 23.18, 40.20),   NE 'arm'
+#         box(22.98, 40.06, 23.05, 40.16))   W bump (non-convex outline)
+#   minus box(23.02, 39.96, 23.10, 40.02)    SW notch
+#
+# Shapely geometries are immutable, so sharing one instance is safe.
+_AOI_GEOM = Polygon(
+    [
+        (23.1, 40.0),
+        (23.1, 40.02),
+        (23.02, 40.02),
+        (23.02, 40.0),
+        (23.0, 40.0),
+        (23.0, 40.06),
+        (22.98, 40.06),
+        (22.98, 40.16),
+        (23.05, 40.16),
+        (23.05, 40.12),
+        (23.08, 40.12),
+        (23.08, 40.2),
+        (23.18, 40.2),
+        (23.18, 40.12),
+        (23.12, 40.12),
+        (23.12, 40.0),
+        (23.1, 40.0),
+    ]
+)
+
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Columns of scene_catalog_coverage_preview.csv, in order
+_COVERAGE_COLUMNS = (
+    "id",
+    "datetime",
+    "tile_name",
+    "cloud_cover",
+    "intersection_area",
+    "intersection_frac",
+)
+
+
+def _geojson_geometries(geoms: List[Any]) -> List[Dict[str, Any]]:
+    """
+    GeoJSON geometry dicts for a batch of shapely geometries.
+
+    shapely.to_geojson encodes the whole batch in GEOS, which is several
+    times faster than calling shapely.geometry.mapping per geometry.
+    """
+    return [json.loads(s) for s in shapely.to_geojson(geoms)]
+
+
+def _dumps(obj: Any, pretty: bool) -> bytes:
+    """
+    Encode obj as JSON bytes, compact or indented (indent=2). Uses orjson
+    (C encoder) when installed; both paths produce the same bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _write_json(obj: Any, path: Path, pretty: bool) -> None:
+    path.write_bytes(_dumps(obj, pretty))
+
+
+def _write_json_array(elements: Iterable[Any], path: Path, pretty: bool) -> List[Any]:
+    """
+    Stream a JSON array to path one element at a time, so the whole array is
+    never encoded in one blob. Bytes match _dumps(list(elements), pretty).
+
+    Returns the written elements.
+    """
+    if pretty:
+        # Elements are re-indented one level (JSON strings never contain raw
+        # newlines, so this only touches whitespace)
+        open_, sep, close = b"[\n  ", b",\n  ", b"\n]"
+    else:
+        open_, sep, close = b"[", b",", b"]"
+
+    written: List[Any] = []
+    # 1 MiB buffer: the per-element writes reach the OS in a few large chunks
+    with path.open("wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        for el in elements:
+            f.write(sep if written else open_)
+            data = _dumps(el, pretty)
+            f.write(data.replace(b"\n", b"\n  ") if pretty else data)
+            written.append(el)
+        f.write(close if written else b"[]")
+    return written
+
 
 @dataclass
 class SceneCatalogTestDataConfig:
@@ -40,6 +140,10 @@ class SceneCatalogTestDataConfig:
         Whether to write a combined GeoJSON with AOI + all tiles.
     preview_csv:
         Whether to write a CSV with per-tile coverage stats.
+    pretty_json:
+        Indent the JSON/GeoJSON artifacts (indent=2). Off by default: the
+        files are consumed by code, and compact output is about half the
+        size and faster to encode. Turn on when inspecting them by hand.
     """
     output_dir: Path
     start_datetime: str = "2021-01-05T10:00:00Z"
@@ -50,6 +154,7 @@ class SceneCatalogTestDataConfig:
     rng_seed: int = 42
     preview_geojson: bool = True
     preview_csv: bool = True
+    pretty_json: bool = False
 
 
 class SceneCatalogTestDataGenerator:
@@ -74,6 +179,20 @@ class SceneCatalogTestDataGenerator:
       - <output_dir>/scene_catalog_coverage_preview.csv  (if preview_csv)
     """
 
+    # Base bounding box around Thessaloniki-ish region (same general area
+    # as AOI, but slightly larger), split into a simple 3x5 grid of tiles.
+    _GRID_BASE_MINX, _GRID_BASE_MINY = 22.9, 39.95
+    _GRID_BASE_MAXX, _GRID_BASE_MAXY = 23.25, 40.25
+    _GRID_NX = 3
+    _GRID_NY = 5
+    _GRID_DX = (_GRID_BASE_MAXX - _GRID_BASE_MINX) / (_GRID_NX + 1)
+    _GRID_DY = (_GRID_BASE_MAXY - _GRID_BASE_MINY) / (_GRID_NY + 1)
+    # Row-major (iy, ix) tile indices, ids and unshifted lower-left corners
+    _GRID_IY, _GRID_IX = np.divmod(np.arange(_GRID_NX * _GRID_NY), _GRID_NX)
+    _GRID_TILE_IDS = tuple(map("tile_{:02d}_{:02d}".format, _GRID_IY.tolist(), _GRID_IX.tolist()))
+    _GRID_MINX = _GRID_BASE_MINX + _GRID_IX * _GRID_DX
+    _GRID_MINY = _GRID_BASE_MINY + _GRID_IY * _GRID_DY
+
     def __init__(self, config: SceneCatalogTestDataConfig) -> None:
         self.config = config
 
@@ -89,7 +208,7 @@ class SceneCatalogTestDataGenerator:
         self.config.output_dir.mkdir(parents=True, exist_ok=True)
 
         aoi_geom, aoi_path = self._write_complex_aoi()
-        items, items_path, coverage_rows = self._write_items(aoi_geom)
+        items, items_path, coverage = self._write_items(aoi_geom)
 
         preview_geojson_path = None
         preview_csv_path = None
@@ -97,7 +216,7 @@ class SceneCatalogTestDataGenerator:
         if self.config.preview_geojson:
             preview_geojson_path = self._write_preview_geojson(aoi_geom, items)
         if self.config.preview_csv:
-            preview_csv_path = self._write_coverage_preview_csv(coverage_rows)
+            preview_csv_path = self._write_coverage_preview_csv(coverage)
 
         LOG.info(
             "SceneCatalogTestDataGenerator: wrote AOI=%s, items=%s, preview_geojson=%s, preview_csv=%s",
@@ -121,6 +240,14 @@ class SceneCatalogTestDataGenerator:
     # ------------------------------------------------------------------ #
 
     def _parse_start_datetime(self) -> datetime:
+        # Fast path for the usual fixed "YYYY-MM-DDTHH:MM:SSZ" form
+        try:
+            return datetime.strptime(
+                self.config.start_datetime, "%Y-%m-%dT%H:%M:%SZ"
+            ).replace(tzinfo=timezone.utc)
+        except ValueError:
+            pass
+
         s = self.config.start_datetime.replace("Z", "+00:00")
         dt = datetime.fromisoformat(s)
         if dt.tzinfo is None:
@@ -129,24 +256,17 @@ class SceneCatalogTestDataGenerator:
 
     def _write_complex_aoi(self) -> Tuple[Any, Path]:
         """
-        Build a slightly more complex non-convex AOI:
+        Write the slightly complex non-convex AOI (see _AOI_GEOM):
 
           - main body      : box(23.0, 40.0, 23.12, 40.12)
           - NE 'arm'       : box(23.08, 40.12, 23.18, 40.20)
+          - W bump         : box(22.98, 40.06, 23.05, 40.16)
           - small notch SW : box(23.02, 39.96, 23.10, 40.02) subtracted
 
-        AOI = union(main_body, arm) minus notch
+        The outline is a constant, so it is hardcoded rather than rebuilt
+        with unary_union/difference on every run.
         """
-        main_body = box(23.0, 40.0, 23.12, 40.12)
-        arm = box(23.08, 40.12, 23.18, 40.20)
-
-        # Extra shape to create a non-convex outline
-        extra = box(22.98, 40.06, 23.05, 40.16)
-
-        raw_geom = unary_union([main_body, arm, extra])
-        # Optional: carve a notch (simple difference)
-        notch = box(23.02, 39.96, 23.10, 40.02)
-        aoi_geom = raw_geom.difference(notch)
+        aoi_geom = _AOI_GEOM
 
         aoi_fc = {
             "type": "FeatureCollection",
@@ -155,17 +275,40 @@ class SceneCatalogTestDataGenerator:
                 {
                     "type": "Feature",
                     "properties": {"id": "AOI_SCENE_CATALOG"},
-                    "geometry": mapping(aoi_geom),
+                    "geometry": _geojson_geometries([aoi_geom])[0],
                 }
             ],
         }
 
         aoi_path = self.config.output_dir / "aoi_scene_catalog.geojson"
-        with aoi_path.open("w", encoding="utf-8") as f:
-            json.dump(aoi_fc, f, indent=2)
+        _write_json(aoi_fc, aoi_path, self.config.pretty_json)
 
         return aoi_geom, aoi_path
 
+    @classmethod
+    @lru_cache(maxsize=16)
+    def _build_grid(cls, mod3: int, mod5: int) -> Tuple[Tuple[str, Any], ...]:
+        """
+        Full 3x5 grid of overlapping tiles for one jitter state.
+
+        The jitter only depends on (idx % 3, idx % 5), so there are at most
+        15 distinct grids; they are built once and shared across timestamps
+        (and generator instances).
+        """
+        # Some deterministic “jitter” per timestamp so geometry
+        # slightly shifts but remains reproducible.
+        shift_x = mod3 * cls._GRID_DX * 0.15
+        shift_y = mod5 * cls._GRID_DY * 0.15
+
+        minx = cls._GRID_MINX + shift_x
+        miny = cls._GRID_MINY + shift_y
+        maxx = minx + cls._GRID_DX * 1.6  # overlapped tiles
+        maxy = miny + cls._GRID_DY * 1.6
+
+        # One vectorized call builds the whole grid
+        boxes = shapely.box(minx, miny, maxx, maxy)
+        return tuple(zip(cls._GRID_TILE_IDS, boxes.tolist()))
+
     def _tile_geometries_for_timestamp(self, idx: int) -> List[Tuple[str, Any]]:
         """
         Define a grid of overlapping tiles around the AOI.
@@ -173,72 +316,86 @@ class SceneCatalogTestDataGenerator:
         We create up to ~15 tiles with small shifts, then truncate
         to tiles_per_timestamp.
         """
-        tiles: List[Tuple[str, Any]] = []
-
-        # Base bounding box around Thessaloniki-ish region
-        # (same general area as AOI, but slightly larger).
-        base_minx, base_miny = 22.9, 39.95
-        base_maxx, base_maxy = 23.25, 40.25
-
-        # Simple 3x5 grid of tiles with overlap
-        nx = 3
-        ny = 5
-        dx = (base_maxx - base_minx) / (nx + 1)
-        dy = (base_maxy - base_miny) / (ny + 1)
-
-        for iy in range(ny):
-            for ix in range(nx):
-                # Some deterministic “jitter” per timestamp so geometry
-                # slightly shifts but remains reproducible.
-                shift_x = (idx % 3) * dx * 0.15
-                shift_y = (idx % 5) * dy * 0.15
-
-                minx = base_minx + ix * dx + shift_x
-                maxx = minx + dx * 1.6  # overlapped tiles
-                miny = base_miny + iy * dy + shift_y
-                maxy = miny + dy * 1.6
-
-                tile_id = f"tile_{iy:02d}_{ix:02d}"
-                tiles.append((tile_id, box(minx, miny, maxx, maxy)))
+        tiles = self._build_grid(idx % 3, idx % 5)
 
         max_tiles = max(1, min(self.config.tiles_per_timestamp, len(tiles)))
-        return tiles[:max_tiles]
+        return list(tiles[:max_tiles])
+
+    def _write_items(self, aoi_geom) -> Tuple[List[Dict[str, Any]], Path, Dict[str, List[Any]]]:
+        """
+        Generate the STAC-like items (see _iter_items) and stream them to
+        scene_catalog_items.json as they are produced.
+
+        The items are still returned in memory since run() exposes them.
+        """
+        # Coverage preview is accumulated column-wise (one list per CSV column)
+        coverage: Dict[str, List[Any]] = {col: [] for col in _COVERAGE_COLUMNS}
+
+        items_path = self.config.output_dir / "scene_catalog_items.json"
+        items = _write_json_array(
+            self._iter_items(aoi_geom, coverage),
+            items_path,
+            self.config.pretty_json,
+        )
 
-    def _write_items(self, aoi_geom) -> Tuple[List[Dict[str, Any]], Path, List[Dict[str, Any]]]:
+        return items, items_path, coverage
+
+    def _iter_items(
+        self, aoi_geom, coverage: Dict[str, List[Any]]
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Create a set of STAC-like items with:
+        Yield a set of STAC-like items with:
 
           - n_timestamps acquisition dates spaced every 5 days
           - up to tiles_per_timestamp tiles per timestamp
           - random cloud_cover in [cloud_min, cloud_max] (deterministic via rng_seed)
           - ONE guaranteed AOI-cover, low-cloud tile per timestamp so that
             coverage >= full_cover_threshold is always achievable in tests.
+
+        The matching coverage preview rows are appended to `coverage`.
         """
-        items: List[Dict[str, Any]] = []
-        coverage_rows: List[Dict[str, Any]] = []
+        n_timestamps = self.config.n_timestamps
 
         start_dt = self._parse_start_datetime()
+        # One ISO string per timestamp, shared by all tiles of that timestamp
+        dt_isos = [
+            (start_dt + i * timedelta(days=5)).isoformat().replace("+00:00", "Z")
+            for i in range(n_timestamps)
+        ]
         aoi_area = float(aoi_geom.area) if aoi_geom.area else 0.0
 
-        rng = random.Random(self.config.rng_seed)
-
-        for i in range(self.config.n_timestamps):
-            dt = start_dt + i * timedelta(days=5)
+        # We reuse the grid generator but truncate so total per timestamp
+        # does not exceed tiles_per_timestamp (1 slot is the AOI cover).
+        remaining_slots = max(self.config.tiles_per_timestamp - 1, 0)
+
+        # Draw all cloud covers up front (vectorized, deterministic via seed).
+        # The AOI-cover tile ALWAYS passes cloud_cover_max=20 used in tests.
+        rng = np.random.default_rng(self.config.rng_seed)
+        low_cloud_max = min(self.config.cloud_max, 19.0)
+        low_cloud_min = self.config.cloud_min
+        cover_clouds = rng.uniform(low_cloud_min, low_cloud_max, n_timestamps).tolist()
+        grid_clouds = rng.uniform(
+            self.config.cloud_min,
+            self.config.cloud_max,
+            (n_timestamps, remaining_slots),
+        ).tolist()
+
+        # The AOI-cover tile (geometry + AOI overlap) does not depend on
+        # the timestamp
+        cover_geom = aoi_geom.buffer(0.01).envelope
+        cover_geom_json = _geojson_geometries([cover_geom])[0]
+
+        cover_inter = cover_geom.intersection(aoi_geom)
+        cover_inter_area = float(cover_inter.area)
+        cover_inter_frac = (cover_inter_area / aoi_area) if aoi_area > 0 else 0.0
+
+        for i in range(n_timestamps):
+            dt_iso = dt_isos[i]
 
             # -------------------------------------------------
             # 1) Guaranteed AOI-cover, LOW-CLOUD tile
             # -------------------------------------------------
-            cover_geom = aoi_geom.buffer(0.01).envelope
-            cover_geom_json = mapping(cover_geom)
-
-            # Ensure this tile ALWAYS passes cloud_cover_max=20 used in tests
-            low_cloud_max = min(self.config.cloud_max, 19.0)
-            low_cloud_min = self.config.cloud_min
-            cover_cloud = rng.uniform(low_cloud_min, low_cloud_max)
-
-            inter = cover_geom.intersection(aoi_geom)
-            inter_area = float(inter.area)
-            inter_frac = (inter_area / aoi_area) if aoi_area > 0 else 0.0
+            cover_cloud = cover_clouds[i]
 
             cover_id = f"FAKE_TILE_{i:02d}_AOI_COVER"
 
@@ -247,46 +404,36 @@ class SceneCatalogTestDataGenerator:
                 "type": "Feature",
                 "geometry": cover_geom_json,
                 "properties": {
-                    "datetime": dt.isoformat().replace("+00:00", "Z"),
+                    "datetime": dt_iso,
                     "cloud_cover": cover_cloud,
                     "platform": "sentinel-2",
                     "constellation": "sentinel-2",
                     "proj:geometry": cover_geom_json,
                     "test:tile_name": "aoi_cover",
-                    "test:intersection_frac": inter_frac,
+                    "test:intersection_frac": cover_inter_frac,
                 },
             }
-            items.append(cover_item)
+            yield cover_item
 
-            coverage_rows.append(
-                {
-                    "id": cover_id,
-                    "datetime": dt.isoformat().replace("+00:00", "Z"),
-                    "tile_name": "aoi_cover",
-                    "cloud_cover": cover_cloud,
-                    "intersection_area": inter_area,
-                    "intersection_frac": inter_frac,
-                }
-            )
+            coverage["id"].append(cover_id)
+            coverage["datetime"].append(dt_iso)
+            coverage["tile_name"].append("aoi_cover")
+            coverage["cloud_cover"].append(cover_cloud)
+            coverage["intersection_area"].append(cover_inter_area)
+            coverage["intersection_frac"].append(cover_inter_frac)
 
             # -------------------------------------------------
             # 2) Additional grid tiles (up to tiles_per_timestamp - 1)
             # -------------------------------------------------
-            # We reuse the grid generator but truncate so total per timestamp
-            # does not exceed tiles_per_timestamp.
-            grid_tiles = self._tile_geometries_for_timestamp(i)
-
-            # We already added 1 tile (AOI cover) above:
-            remaining_slots = max(self.config.tiles_per_timestamp - 1, 0)
-            grid_tiles = grid_tiles[:remaining_slots]
-
-            for tile_name, tile_geom in grid_tiles:
-                geom_json = mapping(tile_geom)
-
-                cloud = rng.uniform(self.config.cloud_min, self.config.cloud_max)
-
-                inter = tile_geom.intersection(aoi_geom)
-                inter_area = float(inter.area)
+            grid_tiles = self._tile_geometries_for_timestamp(i)[:remaining_slots]
+            grid_geoms = [g for _, g in grid_tiles]
+            grid_geom_jsons = _geojson_geometries(grid_geoms)
+            # One vectorized GEOS call for all tiles of this timestamp
+            grid_inter_areas = shapely.area(shapely.intersection(grid_geoms, aoi_geom)).tolist()
+
+            for (tile_name, _), geom_json, inter_area, cloud in zip(
+                grid_tiles, grid_geom_jsons, grid_inter_areas, grid_clouds[i]
+            ):
                 inter_frac = (inter_area / aoi_area) if aoi_area > 0 else 0.0
 
                 item_id = f"FAKE_TILE_{i:02d}_{tile_name.upper()}"
@@ -296,7 +443,7 @@ class SceneCatalogTestDataGenerator:
                     "type": "Feature",
                     "geometry": geom_json,
                     "properties": {
-                        "datetime": dt.isoformat().replace("+00:00", "Z"),
+                        "datetime": dt_iso,
                         "cloud_cover": cloud,
                         "platform": "sentinel-2",
                         "constellation": "sentinel-2",
@@ -305,24 +452,14 @@ class SceneCatalogTestDataGenerator:
                         "test:intersection_frac": inter_frac,
                     },
                 }
-                items.append(item)
-
-                coverage_rows.append(
-                    {
-                        "id": item_id,
-                        "datetime": dt.isoformat().replace("+00:00", "Z"),
-                        "tile_name": tile_name,
-                        "cloud_cover": cloud,
-                        "intersection_area": inter_area,
-                        "intersection_frac": inter_frac,
-                    }
-                )
+                yield item
 
-        items_path = self.config.output_dir / "scene_catalog_items.json"
-        with items_path.open("w", encoding="utf-8") as f:
-            json.dump(items, f, indent=2)
-
-        return items, items_path, coverage_rows
+                coverage["id"].append(item_id)
+                coverage["datetime"].append(dt_iso)
+                coverage["tile_name"].append(tile_name)
+                coverage["cloud_cover"].append(cloud)
+                coverage["intersection_area"].append(inter_area)
+                coverage["intersection_frac"].append(inter_frac)
 
     def _write_preview_geojson(self, aoi_geom, items: List[Dict[str, Any]]) -> Path:
         features: List[Dict[str, Any]] = []
@@ -335,26 +472,26 @@ class SceneCatalogTestDataGenerator:
                     "id": "AOI_SCENE_CATALOG",
                     "layer": "aoi",
                 },
-                "geometry": mapping(aoi_geom),
+                "geometry": _geojson_geometries([aoi_geom])[0],
             }
         )
 
-        # Tile features
-        for it in items:
-            props = it.get("properties", {}) or {}
-            features.append(
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "id": it["id"],
-                        "layer": "tile",
-                        "tile_name": props.get("test:tile_name"),
-                        "cloud_cover": props.get("cloud_cover"),
-                        "intersection_frac": props.get("test:intersection_frac"),
-                    },
-                    "geometry": it["geometry"],
-                }
-            )
+        # Tile features: only the properties are rewritten, the items'
+        # geometry dicts are shared by reference (no copy).
+        features.extend(
+            {
+                "type": "Feature",
+                "properties": {
+                    "id": it["id"],
+                    "layer": "tile",
+                    "tile_name": it["properties"]["test:tile_name"],
+                    "cloud_cover": it["properties"]["cloud_cover"],
+                    "intersection_frac": it["properties"]["test:intersection_frac"],
+                },
+                "geometry": it["geometry"],
+            }
+            for it in items
+        )
 
         fc = {
             "type": "FeatureCollection",
@@ -363,15 +500,22 @@ class SceneCatalogTestDataGenerator:
         }
 
         out_path = self.config.output_dir / "scene_catalog_preview.geojson"
-        with out_path.open("w", encoding="utf-8") as f:
-            json.dump(fc, f, indent=2)
+        _write_json(fc, out_path, self.config.pretty_json)
 
         return out_path
 
-    def _write_coverage_preview_csv(self, coverage_rows: List[Dict[str, Any]]) -> Path:
-        df = pd.DataFrame(coverage_rows)
+    def _write_coverage_preview_csv(self, coverage: Dict[str, List[Any]]) -> Path:
+        """
+        Write the column-wise coverage preview straight to CSV.
+
+        Floats are written with repr(), so the file matches what
+        pd.DataFrame(...).to_csv(index=False) used to produce.
+        """
         out_path = self.config.output_dir / "scene_catalog_coverage_preview.csv"
-        df.to_csv(out_path, index=False)
+        with out_path.open("w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(_COVERAGE_COLUMNS)
+            writer.writerows(zip(*(coverage[col] for col in _COVERAGE_COLUMNS)))
         return out_path
 
 
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from types import MappingProxyType
+
+from affine import Affine
+
+
+@lru_cache(maxsize=None)
+def origin_transform(pixel_size: float) -> Affine:
+    """
+    North-up transform anchored at (0, 0), same as
+    rasterio.transform.from_origin(0.0, 0.0, pixel_size, pixel_size).
+
+    Built with affine directly so importing the generators does not load
+    rasterio/GDAL.
+    """
+    return Affine(pixel_size, 0.0, 0.0, 0.0, -pixel_size, 0.0)
+
+
+TRANSFORM_10M = origin_transform(10.0)
+
+# Shared single-band float32 GTiff profile on the 10 m grid.
+# Read-only: generators build their own profile with
+#   {**BASE_PROFILE_FLOAT32_10M, "height": H, "width": W, ...}
+BASE_PROFILE_FLOAT32_10M = MappingProxyType(
+    {
+        "driver": "GTiff",
+        "count": 1,
+        "dtype": "float32",
+        "transform": TRANSFORM_10M,
+    }
+)
@@ -113,6 +113,7 @@ class BuildSceneCatalogPipelineTest(unittest.TestCase):
                 tiles_per_timestamp=15,
                 preview_geojson=True,
                 preview_csv=True,
+                pretty_json=True,
             )
             gen = SceneCatalogTestDataGenerator(cfg)
             artifacts = gen.run()
@@ -2,14 +2,24 @@ from __future__ import annotations
 
 import json
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used as a fallback
+    orjson = None
+
 from thess_geo_analytics.core.params import StacQueryParams
 
 
+_CATALOG_COLUMNS = ["id", "datetime", "cloud_cover", "platform", "constellation", "collection"]
+
+
 class FakeCdseSceneCatalogService:
     """
     Reusable test double for CdseSceneCatalogService.
@@ -24,6 +34,33 @@ class FakeCdseSceneCatalogService:
     def __init__(self, items: List[Dict[str, Any]]) -> None:
         self._items = items
 
+        clouds = np.array(
+            [_cloud_value(it.get("properties", {}) or {}) for it in items],
+            dtype=np.float64,
+        )
+
+        # Missing / unparsable datetimes become NaT and are never searchable
+        dts = pd.to_datetime(
+            pd.Series(
+                [(it.get("properties", {}) or {}).get("datetime") or None for it in items],
+                dtype=object,
+            ),
+            utc=True,
+            errors="coerce",
+            format="ISO8601",
+        )
+        dt_ns = dts.to_numpy(dtype="datetime64[ns]").view(np.int64)
+
+        # Items kept once in search order (datetime, then cloud_cover; stable on
+        # ties) so a date range is a searchsorted slice
+        valid = np.nonzero(dts.notna().to_numpy())[0]
+        order = valid[np.lexsort((clouds[valid], dt_ns[valid]))]
+
+        self._arr = np.empty(len(order), dtype=object)
+        self._arr[:] = [items[i] for i in order]
+        self._dt_ns = dt_ns[order]
+        self._clouds = clouds[order]
+
     # ----------------------------------------------------------------------
     # STAC-like search filtering
     # ----------------------------------------------------------------------
@@ -34,54 +71,29 @@ class FakeCdseSceneCatalogService:
         date_end: str,
         params: StacQueryParams,
     ) -> Tuple[List[Any], Dict[str, Any]]:
-        # Load AOI geometry to echo back to the pipeline
-        with aoi_geojson_path.open("r", encoding="utf-8") as f:
-            aoi_fc = json.load(f)
-        aoi_geom = aoi_fc["features"][0]["geometry"]
+        # Load AOI geometry to echo back to the pipeline (cached per file version)
+        aoi_geom = _load_aoi_geom(str(aoi_geojson_path), aoi_geojson_path.stat().st_mtime_ns)
 
         start = date.fromisoformat(date_start)
         end = date.fromisoformat(date_end)
         max_cloud = getattr(params, "cloud_cover_max", None)
         max_items = getattr(params, "max_items", None)
 
-        filtered: List[Dict[str, Any]] = []
-        for it in self._items:
-            props = it.get("properties", {}) or {}
-
-            # Timestamp
-            dt_str = props.get("datetime")
-            if not dt_str:
-                continue
+        # Date range on UTC calendar days: [start 00:00, end + 1 day 00:00)
+        start_ns = pd.Timestamp(start, tz="UTC").value
+        end_ns = (pd.Timestamp(end, tz="UTC") + pd.Timedelta(days=1)).value
+        lo, hi = np.searchsorted(self._dt_ns, [start_ns, end_ns], side="left")
 
-            dt = pd.to_datetime(dt_str, utc=True).date()
-            if dt < start or dt > end:
-                continue
-
-            # Cloud cover
-            cc_val = props.get("cloud_cover", None)
-            try:
-                cc_val = float(cc_val)
-            except Exception:
-                cc_val = float("inf")
-
-            if max_cloud is not None and cc_val > max_cloud:
-                continue
+        # Already sorted like a real STAC client might do:
+        # first by datetime, then by cloud_cover ascending
+        candidates = self._arr[lo:hi]
 
-            filtered.append(it)
+        # Cloud cover (written as ~(cc > max) so NaN covers pass,
+        # like the scalar comparison did)
+        if max_cloud is not None:
+            candidates = candidates[~(self._clouds[lo:hi] > max_cloud)]
 
-        # Sort like a real STAC client might do:
-        # first by datetime, then by cloud_cover ascending
-        def _sort_key(item: Dict[str, Any]):
-            props = item.get("properties", {}) or {}
-            dt = pd.to_datetime(props.get("datetime"), utc=True)
-            cc = props.get("cloud_cover", None)
-            try:
-                cc_val = float(cc)
-            except Exception:
-                cc_val = float("inf")
-            return (dt, cc_val)
-
-        filtered.sort(key=_sort_key)
+        filtered: List[Dict[str, Any]] = candidates.tolist()
 
         # Apply max_items if provided
         if max_items is not None:
@@ -93,24 +105,48 @@ class FakeCdseSceneCatalogService:
     # Convert items to DataFrame (used by SceneCatalogBuilder)
     # ----------------------------------------------------------------------
     def items_to_dataframe(self, items: List[Any], *, collection: str) -> pd.DataFrame:
-        rows: List[Dict[str, Any]] = []
-        for i, it in enumerate(items):
-            props = it.get("properties", {}) or {}
-            dt_str = props.get("datetime")
-
-            rows.append(
-                {
-                    "id": it.get("id"),
-                    "datetime": dt_str,
-                    "cloud_cover": props.get("cloud_cover"),
-                    "platform": "sentinel-2a" if (i % 2 == 0) else "sentinel-2b",
-                    "constellation": "sentinel-2",
-                    "collection": collection,
-                }
+        props_list = [it.get("properties", {}) or {} for it in items]
+        records = [
+            (
+                it.get("id"),
+                props.get("datetime"),
+                props.get("cloud_cover"),
+                "sentinel-2a" if (i % 2 == 0) else "sentinel-2b",
+                "sentinel-2",
+                collection,
             )
+            for i, (it, props) in enumerate(zip(items, props_list))
+        ]
 
-        df = pd.DataFrame(rows)
+        df = pd.DataFrame.from_records(records, columns=_CATALOG_COLUMNS)
         if not df.empty:
-            df["datetime"] = pd.to_datetime(df["datetime"], utc=True)
+            # Explicit ISO8601 skips pandas' per-call format inference
+            df["datetime"] = pd.to_datetime(df["datetime"], utc=True, format="ISO8601")
+
+        return df
+
+
+def _cloud_value(props: Dict[str, Any]) -> float:
+    """cloud_cover as float; missing / non-numeric values sort last (inf)."""
+    try:
+        return float(props.get("cloud_cover", None))
+    except Exception:
+        return float("inf")
+
+
+@lru_cache(maxsize=16)
+def _load_aoi_geom(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    First feature geometry of an AOI GeoJSON. The mtime is part of the cache
+    key so a rewritten fixture is re-read. The dict is shared between calls;
+    callers only read it (shape(...)).
+    """
+    return _load_json(Path(path_str))["features"][0]["geometry"]
+
 
-        return df
\ No newline at end of file
+def _load_json(path: Path) -> Any:
+    """Parse a JSON file, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)